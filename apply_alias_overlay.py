@@ -7,16 +7,71 @@ as their corresponding original cards.
 """
 
 import json
+import logging
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
-from card_downloader import YugiohCardDownloader
+from typing import Dict, List, Optional, Set, Tuple
+from card_downloader import YugiohCardDownloader, is_complete_image, log_progress
+
+
+log = logging.getLogger(__name__)
+
+
+# Per-process downloader instance, set up by the pool initializer or on first use
+_DOWNLOADER: Optional[YugiohCardDownloader] = None
+
+
+def _init_worker(optimize_jpeg: bool = True):
+    """Create this process's downloader with the given encoder settings."""
+    global _DOWNLOADER
+    _DOWNLOADER = YugiohCardDownloader(optimize_jpeg=optimize_jpeg)
+
+
+def _get_downloader() -> YugiohCardDownloader:
+    """Return this process's downloader, creating it on first use."""
+    if _DOWNLOADER is None:
+        _init_worker()
+    return _DOWNLOADER
+
+
+def _overlay_worker(image_path: Path, output_path: Path, points: int,
+                    font_scale: float) -> Tuple[bool, Optional[str]]:
+    """
+    Apply points overlay to a single image file.
+    
+    Lives at module level so it can be pickled into a ProcessPoolExecutor.
+    
+    Args:
+        image_path: Path to the source image file
+        output_path: Path to write the processed image to
+        points: Points value to overlay
+        font_scale: Scale factor for font size
+        
+    Returns:
+        Tuple of (success, error message or None)
+    """
+    try:
+        # Let Pillow decode directly from the file and save straight to the output directory
+        _get_downloader().add_points_overlay_from_path(
+            image_path, points, font_scale=font_scale, output_path=output_path
+        )
+        
+        return True, None
+        
+    except Exception as e:
+        return False, str(e)
 
 
 class AliasOverlayProcessor:
     """Processes alias cards and applies point overlays based on original cards."""
     
-    def __init__(self, cards_json_path: str, alias_json_path: str, images_dir: str, output_dir: str = None):
+    # Alias images use a 50% smaller font than freshly downloaded cards
+    FONT_SCALE = 0.5
+    
+    def __init__(self, cards_json_path: str, alias_json_path: str, images_dir: str, output_dir: str = None,
+                 workers: int = None, force: bool = False, optimize_jpeg: bool = True):
         """
         Initialize the processor.
         
@@ -25,6 +80,9 @@ class AliasOverlayProcessor:
             alias_json_path: Path to alias.json with alias mappings
             images_dir: Directory containing alias card images
             output_dir: Directory to save processed images (default: images_dir + '_processed')
+            workers: Number of overlay worker processes (default: number of CPUs)
+            force: Re-process aliases even if their output image already exists
+            optimize_jpeg: Run the JPEG Huffman optimization pass when saving
         """
         self.cards_json_path = Path(cards_json_path)
         self.alias_json_path = Path(alias_json_path)
@@ -36,12 +94,16 @@ class AliasOverlayProcessor:
         else:
             self.output_dir = Path(str(self.images_dir) + '_processed')
         
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.force = force
+        self.optimize_jpeg = optimize_jpeg
+        
+        # Names of files in images_dir, filled in by _collect_jobs
+        self._image_set: Set[str] = set()
+        
         # Create output directory if it doesn't exist
         self.output_dir.mkdir(exist_ok=True)
         
-        # Create downloader instance to use its overlay functionality
-        self.downloader = YugiohCardDownloader()
-        
         # Load data
         self.cards_data = self._load_cards_data()
         self.alias_data = self._load_alias_data()
@@ -70,82 +132,97 @@ class AliasOverlayProcessor:
         total_skipped = 0
         total_errors = 0
         
-        print(f"🚀 Starting alias overlay processing...")
-        print(f"📁 Input directory: {self.images_dir.absolute()}")
-        print(f"💾 Output directory: {self.output_dir.absolute()}")
-        print(f"📊 Found {len(self.alias_data)} original cards with aliases\n")
+        log.info("🚀 Starting alias overlay processing...")
+        log.info("📁 Input directory: %s", self.images_dir.absolute())
+        log.info("💾 Output directory: %s", self.output_dir.absolute())
+        log.info("📊 Found %d original cards with aliases", len(self.alias_data))
         
-        for original_code, alias_list in self.alias_data.items():
-            # Get points from original card
-            if original_code not in self.cards_data:
-                print(f"⚠️  Original card {original_code} not found in cards.json, skipping aliases")
-                total_skipped += len(alias_list)
-                continue
-            
-            original_card = self.cards_data[original_code]
-            points = original_card.get('points', 0)
-            original_name = original_card.get('name', f'Card {original_code}')
-            
-            print(f"📋 Processing aliases for: {original_name} (Code: {original_code}, Points: {points})")
+        # Collect every overlay job up front so they can be run in parallel
+        jobs, skipped = self._collect_jobs()
+        total_skipped += sum(skipped.values())
+        
+        if skipped['missing_original']:
+            log.info("⚠️  Skipped %d aliases whose original card is not in cards.json", skipped['missing_original'])
+        if skipped['missing_image']:
+            log.info("⚠️  Skipped %d aliases with no image in the input directory", skipped['missing_image'])
+        if skipped['already_processed']:
+            log.info("⏭️  Skipped %d aliases that were already processed", skipped['already_processed'])
+        
+        log.info("⚙️  Applying overlays to %d images with %d workers...", len(jobs), self.workers)
+        
+        # Decode/resize/encode is CPU-bound, so spread it across processes
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.optimize_jpeg,)
+        ) as executor:
+            results = executor.map(
+                _overlay_worker,
+                [image_path for image_path, _, _ in jobs],
+                [self.output_dir / f"{alias_code}.jpg" for _, _, alias_code in jobs],
+                [points for _, points, _ in jobs],
+                [self.FONT_SCALE] * len(jobs),
+                chunksize=max(1, len(jobs) // (self.workers * 4)),
+            )
             
-            # Process each alias
-            for alias_code in alias_list:
-                alias_code_str = str(alias_code)
-                image_path = self.images_dir / f"{alias_code_str}.jpg"
-                
-                if not image_path.exists():
-                    print(f"  ⚠️  Image not found: {alias_code_str}.jpg")
-                    total_skipped += 1
-                    continue
-                
-                # Apply overlay
-                success = self._apply_overlay_to_image(image_path, points, alias_code_str)
-                
+            for i, ((_, points, alias_code), (success, error)) in enumerate(zip(jobs, results), 1):
                 if success:
-                    print(f"  ✅ Applied {points} points overlay to: {alias_code_str}.jpg")
+                    log.debug("  ✅ Applied %s points overlay to: %s.jpg", points, alias_code)
                     total_processed += 1
                 else:
-                    print(f"  ❌ Failed to process: {alias_code_str}.jpg")
+                    log.warning("  ❌ Failed to process %s.jpg: %s", alias_code, error)
                     total_errors += 1
-            
-            print()  # Empty line between original cards
+                
+                log_progress(i, len(jobs))
         
         # Final summary
-        print(f"🎉 Processing completed!")
-        print(f"✅ Successfully processed: {total_processed} images")
-        print(f"⚠️  Skipped: {total_skipped} images")
-        print(f"❌ Errors: {total_errors} images")
+        log.info("🎉 Processing completed!")
+        log.info("✅ Successfully processed: %d images", total_processed)
+        log.info("⚠️  Skipped: %d images", total_skipped)
+        log.info("❌ Errors: %d images", total_errors)
     
-    def _apply_overlay_to_image(self, image_path: Path, points: int, alias_code: str) -> bool:
+    @staticmethod
+    def _scan_files(directory: Path) -> Set[str]:
+        """Return the names of regular files in a directory using a single scandir pass."""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    
+    def _collect_jobs(self) -> Tuple[List[Tuple[Path, int, str]], Dict[str, int]]:
         """
-        Apply points overlay to a single image.
+        Build the flat list of overlay jobs in a single pass over alias.json.
+        
+        Image presence is checked against one directory scan instead of
+        stat-ing every alias file individually.
         
-        Args:
-            image_path: Path to the image file
-            points: Points value to overlay
-            alias_code: Alias card code for logging
-            
         Returns:
-            True if successful, False otherwise
+            Tuple of (list of (image_path, points, alias_code) jobs, skip counts by reason)
         """
-        try:
-            # Read the image
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            
-            # Apply overlay using the downloader's method with 50% smaller font
-            modified_image_data = self.downloader.add_points_overlay(image_data, points, font_scale=0.5)
-            
-            # Save to output directory
-            output_path = self.output_dir / f"{alias_code}.jpg"
-            with open(output_path, 'wb') as f:
-                f.write(modified_image_data)
-            
-            return True
+        self._image_set = self._scan_files(self.images_dir)
+        # Only outputs that exist at all need the more expensive completeness check
+        existing_outputs = set() if self.force else self._scan_files(self.output_dir)
+        # Outputs older than either JSON file may carry outdated points
+        source_mtime = max(self.cards_json_path.stat().st_mtime, self.alias_json_path.stat().st_mtime)
+        
+        jobs = []
+        skipped = {'missing_original': 0, 'missing_image': 0, 'already_processed': 0}
+        for original_code, alias_list in self.alias_data.items():
+            original_card = self.cards_data.get(original_code)
+            if original_card is None:
+                skipped['missing_original'] += len(alias_list)
+                continue
             
-        except Exception as e:
-            print(f"  ❌ Error processing {alias_code}: {e}")
-            return False
+            points = original_card.get('points', 0)
+            for alias_code in alias_list:
+                filename = f"{alias_code}.jpg"
+                if filename not in self._image_set:
+                    skipped['missing_image'] += 1
+                elif filename in existing_outputs and is_complete_image(self.output_dir / filename,
+                                                                        newer_than=source_mtime):
+                    skipped['already_processed'] += 1
+                else:
+                    jobs.append((self.images_dir / filename, points, str(alias_code)))
+        
+        return jobs, skipped
 
 
 def main():
@@ -175,20 +252,47 @@ def main():
         default=None,
         help='Output directory for processed images (default: images_dir + "_processed")'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=None,
+        help='Number of overlay worker processes (default: number of CPUs)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-process aliases even if their output image already exists'
+    )
+    parser.add_argument(
+        '--fast-encode',
+        action='store_true',
+        help='Skip the JPEG Huffman optimization pass (faster, slightly larger files)'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Log every alias instead of periodic progress'
+    )
     
     args = parser.parse_args()
     
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    
     # Check if files exist
     if not os.path.exists(args.cards):
-        print(f"❌ Cards JSON file not found: {args.cards}")
+        log.error("❌ Cards JSON file not found: %s", args.cards)
         return 1
     
     if not os.path.exists(args.alias):
-        print(f"❌ Alias JSON file not found: {args.alias}")
+        log.error("❌ Alias JSON file not found: %s", args.alias)
         return 1
     
     if not os.path.exists(args.images):
-        print(f"❌ Images directory not found: {args.images}")
+        log.error("❌ Images directory not found: %s", args.images)
         return 1
     
     # Process aliases
@@ -196,7 +300,10 @@ def main():
         cards_json_path=args.cards,
         alias_json_path=args.alias,
         images_dir=args.images,
-        output_dir=args.output
+        output_dir=args.output,
+        workers=args.workers,
+        force=args.force,
+        optimize_jpeg=not args.fast_encode
     )
     
     processor.process_all_aliases()
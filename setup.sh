@@ -20,7 +20,7 @@ if command -v python3 &> /dev/null; then
     
     echo "✅ Python environment ready"
 else
-    echo "❌ Python 3 not found. Please install Python 3.6+ to use the script."
+    echo "❌ Python 3 not found. Please install Python 3.9+ to use the script."
     exit 1
 fi
 